@@ -1,6 +1,7 @@
 import bpy
-import bmesh
+import functools
 import mathutils
+import numpy as np
 import os
 import math
 from bpy.props import StringProperty, EnumProperty, IntProperty
@@ -12,8 +13,49 @@ try:
 except Exception:
 	_PIL_AVAILABLE = False
 
+# Translation table mapping filename-invalid characters to '_' (single C pass
+# instead of chained str.replace calls)
+_INVALID_FN = str.maketrans({c: '_' for c in '|:*?<>"'})
+
+# File extension per export format
+_EXPORT_EXTS = {'PNG': '.png', 'WEBP': '.webp', 'JPEG': '.jpg'}
+
+# Unit camera offsets per angle: (forward, flipped) — multiplied by distance
+_ANGLE_OFFSETS = {
+    "Front": ((0, -1, 0), (0, 1, 0)),
+    "Isometric": ((0.7, -0.7, 0.7), (-0.7, 0.7, 0.7)),
+    "Side": ((1, 0, 0), (-1, 0, 0)),
+}
+
+@functools.lru_cache(maxsize=720)
+def _custom_rot(axis, deg):
+    """Frozen rotation matrix for the custom camera orbit, cached per degree:
+    the live preview slider requests the same angles over and over."""
+    return mathutils.Matrix.Rotation(math.radians(deg), 4, axis).freeze()
+
+# Shared exporter instance so repeat exports don't re-run scene/lighting setup
+_exporter_singleton = None
+
+def _get_exporter():
+    global _exporter_singleton
+    if _exporter_singleton is None:
+        _exporter_singleton = BlenderExporter()
+    else:
+        # Bounds may have changed between operator runs; drop stale entries
+        _exporter_singleton._bbox_cache.clear()
+        # clear_scene_and_cache resets the initialized flag after wiping the
+        # scene (sun included); re-run the idempotent setup so lighting comes
+        # back before the next export
+        _exporter_singleton.setup_scene()
+    return _exporter_singleton
+
+@bpy.app.handlers.persistent
+def _invalidate_exporter_on_load(_dummy):
+    global _exporter_singleton
+    _exporter_singleton = None
+
 # --- Live camera preview helpers ---
-def refresh_camera_preview(context):
+def refresh_camera_preview(context, force=False):
     """Recreate/position camera based on current properties for live preview."""
     try:
         props = context.scene.anim_exporter
@@ -21,7 +63,7 @@ def refresh_camera_preview(context):
         return
     if not props:
         return
-    exporter = BlenderExporter()
+    exporter = _get_exporter()
     target = exporter.find_target_object()
     if not target:
         return
@@ -33,6 +75,19 @@ def refresh_camera_preview(context):
     if context.object and context.object.animation_data and context.object.animation_data.action:
         action_name = context.object.animation_data.action.name
 
+    # Skip the rebuild when nothing that affects the camera actually changed:
+    # property update callbacks fire for every slider tick
+    cam_key = str((
+        props.camera_angle, getattr(props, 'custom_orientation', ''),
+        getattr(props, 'custom_camera_deg', 0), props.flip_animation,
+        props.auto_camera, props.manual_camera_scale, props.frame_size,
+        target.name, action_name,
+    ))
+    scene = context.scene
+    if not force and scene.get('_a32d_last_cam_key') == cam_key and scene.camera:
+        return
+    scene['_a32d_last_cam_key'] = cam_key
+
     # If this action has stored rotation correction, apply it temporarily to the target for accurate camera placement
     correction_deg = 0
     orig_matrix = None
@@ -57,9 +112,9 @@ def refresh_camera_preview(context):
             angle_type=angle_map.get(props.camera_angle, 'Side'),
             animation_name=action_name,
             auto_camera=props.auto_camera,
-            manual_scale=props.manual_camera_scale
+            manual_scale=props.manual_camera_scale,
+            flip=props.flip_animation
         )
-        exporter.setup_flip_modifier(props.flip_animation, target, angle_map.get(props.camera_angle, 'Side'))
     else:
         # В ручному режимі застосовуємо слайдери
         camera = bpy.context.scene.camera
@@ -82,9 +137,37 @@ def refresh_camera_preview(context):
         except Exception:
             pass
 
+def _deferred_camera_refresh():
+    """Timer body: collapse a burst of slider ticks into one camera rebuild."""
+    try:
+        refresh_camera_preview(bpy.context)
+    except Exception:
+        pass
+    return None
+
 def on_camera_prop_update(self, context):
     """Update callback for camera-related properties to refresh preview."""
-    refresh_camera_preview(context)
+    # Debounce: rapid slider drags re-trigger this callback many times per
+    # second; one pending timer rebuilds the camera once the value settles
+    if not bpy.app.timers.is_registered(_deferred_camera_refresh):
+        bpy.app.timers.register(_deferred_camera_refresh, first_interval=0.1)
+
+def _view3d_target():
+    """First 3D View as (area, window_region, space), or (None, None, None).
+
+    Shared by the viewport-setup paths so each caller does one scan instead
+    of its own nested area/region/space loops."""
+    try:
+        for area in bpy.context.screen.areas:
+            if area.type == 'VIEW_3D':
+                space = area.spaces.active
+                for region in area.regions:
+                    if region.type == 'WINDOW':
+                        return area, region, space
+                return area, None, space
+    except Exception:
+        pass
+    return None, None, None
 
 def _set_3dview_left_ortho_and_show_sidebar():
     """Set the first 3D View to LEFT with a proper override (like clicking -X).
@@ -141,20 +224,26 @@ def _remove_default_collection_child_on_start():
             return
         master = scene.collection
         # Move contents of any child named 'Collection' directly to master, then remove that child
+        # Membership via name sets: `name in collection.objects` is a linear
+        # RNA scan, which turns the flatten into O(n^2) on big imports
+        master_names = set(master.objects.keys())
+        master_children = set(master.children.keys())
         for child in list(master.children):
             if child.name == 'Collection':
                 # Move objects
                 for obj in list(child.objects):
-                    if obj.name not in master.objects:
+                    if obj.name not in master_names:
                         master.objects.link(obj)
+                        master_names.add(obj.name)
                     try:
                         child.objects.unlink(obj)
                     except Exception:
                         pass
                 # Move sub-collections
                 for sub in list(child.children):
-                    if sub not in master.children:
+                    if sub.name not in master_children:
                         master.children.link(sub)
+                        master_children.add(sub.name)
                     try:
                         child.children.unlink(sub)
                     except Exception:
@@ -204,16 +293,12 @@ def _startup_setup_once():
         _setup_workspace_tabs()
         
         # Налаштування viewport: Wireframe, приховання кісток і вимкнення X-Ray
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for space in area.spaces:
-                    if space.type == 'VIEW_3D':
-                        space.shading.type = 'WIREFRAME'
-                        space.overlay.show_bones = False
-                        space.shading.show_xray = False  # Вимикаємо X-Ray
-                        space.shading.show_xray_wireframe = False  # Вимикаємо X-Ray для wireframe
-                        break
-                break
+        _area, _region, space = _view3d_target()
+        if space is not None:
+            space.shading.type = 'WIREFRAME'
+            space.overlay.show_bones = False
+            space.shading.show_xray = False  # Вимикаємо X-Ray
+            space.shading.show_xray_wireframe = False  # Вимикаємо X-Ray для wireframe
         
         # Hide system console at the end
         if done:
@@ -228,8 +313,93 @@ def _startup_setup_once():
 
 class BlenderExporter:
     def __init__(self):
+        # Cache of (center, size) keyed by (object id, frame) to avoid
+        # rebuilding world-space bbox corners in every bounds helper
+        self._bbox_cache = {}
+        self._sheet_spill = None  # temp file backing a memmap'd sheet, if any
         self.setup_scene()
 
+    @staticmethod
+    def _begin_fast_render():
+        """Enable persistent render data, cap default EEVEE samples and force
+        the Standard view transform for the batch; returns the previous
+        values for _end_fast_render."""
+        scene = bpy.context.scene
+        prev_persistent = scene.render.use_persistent_data
+        scene.render.use_persistent_data = True
+        prev_samples = None
+        try:
+            eevee = scene.eevee
+            if eevee.taa_render_samples == 64:  # only cap the untouched default
+                prev_samples = 64
+                eevee.taa_render_samples = 16
+        except Exception:
+            pass
+        # Standard keeps every output path identical: save_render/write_still
+        # apply the scene view transform (AgX by default), while the Viewer
+        # Node paths convert linear->sRGB themselves
+        prev_view = None
+        try:
+            prev_view = scene.view_settings.view_transform
+            scene.view_settings.view_transform = 'Standard'
+        except Exception:
+            prev_view = None
+        return prev_persistent, prev_samples, prev_view
+
+    @staticmethod
+    def _end_fast_render(state):
+        prev_persistent, prev_samples, prev_view = state
+        try:
+            scene = bpy.context.scene
+            scene.render.use_persistent_data = prev_persistent
+            if prev_samples is not None:
+                scene.eevee.taa_render_samples = prev_samples
+            if prev_view is not None:
+                scene.view_settings.view_transform = prev_view
+        except Exception:
+            pass
+
+    @staticmethod
+    def _attach_viewer():
+        """Add a temporary RLayers->Viewer pair to the scene compositor.
+
+        Existing user nodes are left untouched; returns the state tuple
+        _detach_viewer needs to undo the change."""
+        scene = bpy.context.scene
+        prev_use_nodes = scene.use_nodes
+        scene.use_nodes = True
+        tree = scene.node_tree
+        rl_node = tree.nodes.new('CompositorNodeRLayers')
+        viewer_node = tree.nodes.new('CompositorNodeViewer')
+        tree.links.new(rl_node.outputs[0], viewer_node.inputs[0])
+        tree.nodes.active = viewer_node  # the Viewer Node image follows the active viewer
+        return prev_use_nodes, rl_node, viewer_node
+
+    @staticmethod
+    def _detach_viewer(state):
+        prev_use_nodes, rl_node, viewer_node = state
+        try:
+            tree = bpy.context.scene.node_tree
+            tree.nodes.remove(viewer_node)
+            tree.nodes.remove(rl_node)
+        except Exception:
+            pass
+        try:
+            bpy.context.scene.use_nodes = prev_use_nodes
+        except Exception:
+            pass
+
+    def release_sheet_spill(self):
+        """Delete the temp file backing the last memmap'd spritesheet."""
+        spill = self._sheet_spill
+        self._sheet_spill = None
+        if spill is not None:
+            try:
+                spill.close()
+                os.unlink(spill.name)
+            except Exception:
+                pass
+
     def analyze_and_store_action_rotations(self, armature_obj=None):
         """Analyze actions and store simple Z-rotation correction (degrees) on each action
         as action['rotation_correction']. This attempts to detect 90deg misalignments from the
@@ -301,43 +471,29 @@ class BlenderExporter:
         except Exception:
             pass
     
-    def _move_object_to_scene_root(self, obj):
-        try:
-            scene = bpy.context.scene
-            if not scene or not obj:
-                return
-            master = scene.collection
-            # Link to master if not already
-            if obj.name not in master.objects:
-                master.objects.link(obj)
-            # Unlink from all other collections
-            for coll in list(obj.users_collection):
-                if coll is not master:
-                    try:
-                        coll.objects.unlink(obj)
-                    except Exception:
-                        pass
-        except Exception:
-            pass
-        
     def setup_scene(self):
-        bpy.context.scene.render.engine = 'BLENDER_EEVEE_NEXT'
-        bpy.context.scene.render.film_transparent = True
+        # Idempotent: lights/world are only configured once per scene
+        scene = bpy.context.scene
+        if scene.get('_a32d_initialized'):
+            return
+        scene.render.engine = 'BLENDER_EEVEE_NEXT'
+        scene.render.film_transparent = True
         self.setup_lighting()
+        scene['_a32d_initialized'] = True
         
     def setup_lighting(self):
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in bpy.data.objects:
+        # Direct data-API construction: no operator overhead, no depsgraph
+        # update per call, and the new object lands in the scene root directly
+        for obj in list(bpy.data.objects):
             if obj.type == 'LIGHT':
-                obj.select_set(True)
-        bpy.ops.object.delete()
-        
-        bpy.ops.object.light_add(type='SUN', location=(5, 5, 10))
-        sun = bpy.context.active_object
-        sun.data.energy = 3
-        sun.data.color = (1.0, 1.0, 1.0)  # White color #FFFFFF
-        # Ensure sun is in Scene Collection root
-        self._move_object_to_scene_root(sun)
+                bpy.data.objects.remove(obj, do_unlink=True)
+
+        sun_data = bpy.data.lights.new("Sun", 'SUN')
+        sun_data.energy = 3
+        sun_data.color = (1.0, 1.0, 1.0)  # White color #FFFFFF
+        sun = bpy.data.objects.new("Sun", sun_data)
+        bpy.context.scene.collection.objects.link(sun)
+        sun.location = (5, 5, 10)
         
         # Set world background to white
         if bpy.context.scene.world:
@@ -347,20 +503,24 @@ class BlenderExporter:
             if bg_node:
                 bg_node.inputs[0].default_value = (1.0, 1.0, 1.0, 1.0)  # White color #FFFFFF
         
-    def setup_camera(self, target_object, angle_type="Front", animation_name=None, auto_camera=True, manual_scale=1.0):
+    def setup_camera(self, target_object, angle_type="Front", animation_name=None, auto_camera=True, manual_scale=1.0, flip=False):
         # Якщо автоматична камера вимкнена, не чіпаємо існуючу камеру
         if not auto_camera:
             camera = bpy.context.scene.camera
             if camera:
-                return  # Залишаємо камеру як є
+                return None, None  # Залишаємо камеру як є
         
-        if bpy.data.objects.get("Camera"):
-            bpy.data.objects.remove(bpy.data.objects["Camera"])
-            
-        bpy.ops.object.camera_add()
-        camera = bpy.context.active_object
-        # Ensure camera is in Scene Collection root
-        self._move_object_to_scene_root(camera)
+        # Reuse the existing camera when possible: a live preview only needs
+        # location/rotation/ortho_scale updated in place
+        camera = bpy.data.objects.get("Camera")
+        if camera is None or camera.type != 'CAMERA':
+            if camera is not None:
+                bpy.data.objects.remove(camera)
+            # Data-API construction links straight into the scene root, avoiding
+            # the context resolution and scene update a bpy.ops call would run
+            cam_data = bpy.data.cameras.new("Camera")
+            camera = bpy.data.objects.new("Camera", cam_data)
+            bpy.context.scene.collection.objects.link(camera)
         
         # Use static object bounds for consistent scale across all animations
         center, size = self.get_static_bounds(target_object)
@@ -370,13 +530,11 @@ class BlenderExporter:
             size *= manual_scale
         
         distance = size * 2.5
-        
-        if angle_type == "Front":
-            camera.location = (center.x, center.y - distance, center.z)
-        elif angle_type == "Isometric":
-            camera.location = (center.x + distance * 0.7, center.y - distance * 0.7, center.z + distance * 0.7)
-        elif angle_type == "Side":
-            camera.location = (center.x + distance, center.y, center.z)
+
+        if angle_type in _ANGLE_OFFSETS:
+            # Precomputed unit offsets cover both the forward and flipped placements
+            ox, oy, oz = _ANGLE_OFFSETS[angle_type][1 if flip else 0]
+            camera.location = (center.x + ox * distance, center.y + oy * distance, center.z + oz * distance)
         elif angle_type == "Custom":
             # Position and rotate based on custom orientation
             props = bpy.context.scene.anim_exporter
@@ -391,66 +549,40 @@ class BlenderExporter:
             else:  # 'DOWN'
                 base_loc = mathutils.Vector((center.x, center.y, center.z - distance))
                 axis = 'X'  # orbit vertically from bottom view
-            angle_rad = math.radians(angle_deg)
-            rot_mat = mathutils.Matrix.Rotation(angle_rad, 4, axis)
+            rot_mat = _custom_rot(axis, angle_deg)
             offset = base_loc - center
             rotated = rot_mat @ offset
+            if flip:
+                # Mirror around the model center to preserve custom orientation
+                rotated = -rotated
             new_loc = center + rotated
             camera.location = (new_loc.x, new_loc.y, new_loc.z)
-            
+
         direction = center - camera.location
         camera.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
         camera.data.type = 'ORTHO'
         camera.data.ortho_scale = size * 1.2
         bpy.context.scene.camera = camera
-        
-    def setup_flip_modifier(self, flip_enabled, target_object, angle_type):
-        """Setup camera flip by moving to opposite side"""
-        if flip_enabled:
-            camera = bpy.context.scene.camera
-            if camera:
-                # Get model center
-                bbox = [target_object.matrix_world @ mathutils.Vector(corner) for corner in target_object.bound_box]
-                min_coords = [min([v[i] for v in bbox]) for i in range(3)]
-                max_coords = [max([v[i] for v in bbox]) for i in range(3)]
-                center = mathutils.Vector([(min_coords[i] + max_coords[i]) / 2 for i in range(3)])
-                
-                # Flip camera position horizontally around model center
-                if angle_type == "Front":
-                    # Move camera to back instead of front
-                    size = max(max_coords[i] - min_coords[i] for i in range(3))
-                    distance = size * 2.5
-                    camera.location = (center.x, center.y + distance, center.z)
-                elif angle_type == "Isometric":
-                    # Flip isometric position
-                    size = max(max_coords[i] - min_coords[i] for i in range(3))
-                    distance = size * 2.5
-                    camera.location = (center.x - distance * 0.7, center.y + distance * 0.7, center.z + distance * 0.7)
-                elif angle_type == "Side":
-                    # Move to opposite side
-                    size = max(max_coords[i] - min_coords[i] for i in range(3))
-                    distance = size * 2.5
-                    camera.location = (center.x - distance, center.y, center.z)
-                elif angle_type == "Custom":
-                    # Mirror current camera position around the model center to preserve custom orientation
-                    offset = camera.location - center
-                    camera.location = center - offset
-                
-                # Reorient camera to look at center
-                direction = center - camera.location
-                camera.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
+        return center, size
         
     def find_target_object(self):
-        for obj in bpy.data.objects:
+        # Single pass over scene objects (not all datablocks): armatures win,
+        # first non-empty mesh is remembered as fallback
+        first_mesh = None
+        for obj in bpy.context.view_layer.objects:
             if obj.type == 'ARMATURE':
                 return obj
-        for obj in bpy.data.objects:
-            if obj.type == 'MESH' and len(obj.data.vertices) > 0:
-                return obj
-        return None
+            if first_mesh is None and obj.type == 'MESH' and len(obj.data.vertices) > 0:
+                first_mesh = obj
+        return first_mesh
         
-    def export_animation_frames(self, animation_name, output_dir, frame_size=(128, 128), 
-                               start_frame=None, end_frame=None, camera_angle="Front", flip_animation=False, export_format='PNG', base_name_override=None):
+    def _prepare_export(self, animation_name, frame_size, start_frame, end_frame,
+                        camera_angle, flip_animation, export_format):
+        """Shared export setup: camera, resolution, action (with rotation
+        correction) and the clamped frame list.
+
+        Returns (target_obj, action, orig_matrix, frames_to_export, props).
+        """
         self.export_format = export_format
         target_obj = self.find_target_object()
         if not target_obj:
@@ -460,15 +592,15 @@ class BlenderExporter:
         
         # Налаштовуємо камеру тільки якщо авто режим включений
         if props.auto_camera:
-            self.setup_camera(target_obj, camera_angle, animation_name, props.auto_camera, props.manual_camera_scale)
-            self.setup_flip_modifier(flip_animation, target_obj, camera_angle)
+            self.setup_camera(target_obj, camera_angle, animation_name, props.auto_camera, props.manual_camera_scale, flip=flip_animation)
         else:
             # В ручному режимі не чіпаємо камеру при експорті
             pass
         
         bpy.context.scene.render.resolution_x = frame_size[0]
         bpy.context.scene.render.resolution_y = frame_size[1]
-        
+        bpy.context.scene.render.resolution_percentage = int(getattr(props, 'render_scale', 100))
+
         action = bpy.data.actions.get(animation_name)
         if not action:
             raise Exception(f"Animation '{animation_name}' not found")
@@ -477,7 +609,6 @@ class BlenderExporter:
         orig_matrix = None
         try:
             if target_obj.type == 'ARMATURE':
-                target_obj.animation_data_create()
                 # check for rotation correction stored on action
                 correction = 0
                 try:
@@ -491,7 +622,11 @@ class BlenderExporter:
                         target_obj.matrix_world = rotm @ orig_matrix
                     except Exception:
                         orig_matrix = None
-                target_obj.animation_data.action = action
+                # Skip the redundant re-assignment when the action is already current
+                anim_data = target_obj.animation_data
+                if anim_data is None or anim_data.action is not action:
+                    target_obj.animation_data_create()
+                    target_obj.animation_data.action = action
         except Exception:
             # fallback assignment
             try:
@@ -500,8 +635,10 @@ class BlenderExporter:
             except Exception:
                 pass
             
-        action_start = int(action.frame_range[0])
-        action_end = int(action.frame_range[1])
+        # frame_range is recomputed from F-curves on each access; read it once
+        fr = action.frame_range
+        action_start = int(fr[0])
+        action_end = int(fr[1])
         if start_frame is None:
             start_frame = action_start
         if end_frame is None:
@@ -510,29 +647,124 @@ class BlenderExporter:
         end_frame = min(action_end, int(end_frame))
         if start_frame > end_frame:
             start_frame, end_frame = end_frame, start_frame
-        frames_to_export = list(range(start_frame, end_frame + 1))
-        
+        frame_step = max(1, int(getattr(props, 'frame_step', 1)))
+        # A range is enough everywhere downstream (len, slicing, indexing)
+        # and avoids materializing an O(N) list per export
+        frames_to_export = range(start_frame, end_frame + 1, frame_step)
+        return target_obj, action, orig_matrix, frames_to_export, props
+
+    def export_animation_frames(self, animation_name, output_dir, frame_size=(128, 128),
+                               start_frame=None, end_frame=None, camera_angle="Front", flip_animation=False, export_format='PNG', base_name_override=None):
+        target_obj, action, orig_matrix, frames_to_export, props = self._prepare_export(
+            animation_name, frame_size, start_frame, end_frame, camera_angle, flip_animation, export_format
+        )
+
         os.makedirs(output_dir, exist_ok=True)
-        
+
+        # Ordered output paths, known up front — callers use these directly
+        # instead of re-enumerating the output directory
+        name_source = base_name_override if base_name_override else animation_name
+        clean_name = name_source.translate(_INVALID_FN)
+        file_ext = _EXPORT_EXTS.get(self.export_format, '.png')
+        path_template = os.path.join(output_dir, f"{clean_name}_frame_{{:04d}}{file_ext}")
+        frame_paths = [path_template.format(i) for i in range(len(frames_to_export))]
+
+        # Persistent data keeps shader compiles, BVHs and mesh uploads alive
+        # across frames; low TAA is plenty for sprite-sized output. Applied
+        # before the parallel attempt so the saved worker .blend (and its
+        # Standard view transform) matches the in-process paths.
+        fast_render_state = self._begin_fast_render()
+
+        # Try parallel rendering in background Blender workers first; fall back
+        # to the sequential in-process loop if it is disabled or fails
+        if getattr(props, 'parallel_render', False):
+            done = self._export_frames_parallel(frames_to_export, output_dir, clean_name, export_format)
+            if done:
+                self._end_fast_render(fast_render_state)
+                try:
+                    if orig_matrix is not None and target_obj is not None:
+                        target_obj.matrix_world = orig_matrix
+                except Exception:
+                    pass
+                return frame_paths
+
+        # Loop-invariant render settings: set the format once, restore after the loop
+        image_settings = bpy.context.scene.render.image_settings
+        original_format = image_settings.file_format
+        original_compression = image_settings.compression
+        image_settings.file_format = self.export_format
+        if self.export_format == 'PNG':
+            # zlib level dominates PNG save time; frames don't need max compression
+            image_settings.compression = int(getattr(props, 'png_compression', 15))
+        elif self.export_format == 'JPEG':
+            image_settings.quality = 90
+
+        # Optional render cache: identical (animation, frame, camera, size) renders
+        # are copied from disk instead of re-rendered
+        use_cache = getattr(props, 'use_frame_cache', False)
+        cache_dir = None
+        if use_cache:
+            import hashlib
+            import shutil
+            cache_dir = os.path.join(output_dir, ".cache")
+            os.makedirs(cache_dir, exist_ok=True)
+            # Label the renders with everything that can change the pixels:
+            # a moved camera or different engine must not produce cache hits
+            cam = bpy.context.scene.camera
+            cam_sig = tuple(round(v, 6) for row in cam.matrix_world for v in row) if cam else None
+            cache_sig = f"{animation_name}|{camera_angle}|{flip_animation}|{frame_size}|{self.export_format}|{cam_sig}|{bpy.context.scene.render.engine}|{bpy.context.scene.render.resolution_percentage}"
+
+        # Overlap encoding/writes with rendering when PIL can do the encoding
+        # off the main thread (cacheless exports only; cache needs the sync path)
+        if not use_cache and _PIL_AVAILABLE:
+            if self._export_frames_threaded(frames_to_export, output_dir, clean_name, file_ext):
+                bpy.context.scene.render.image_settings.file_format = original_format
+                bpy.context.scene.render.image_settings.compression = original_compression
+                self._end_fast_render(fast_render_state)
+                try:
+                    if orig_matrix is not None and target_obj is not None:
+                        target_obj.matrix_world = orig_matrix
+                except Exception:
+                    pass
+                return frame_paths
+
         for i, frame_num in enumerate(frames_to_export):
-            bpy.context.scene.frame_set(frame_num)
-            
-            # Clean filename - remove invalid characters
-            name_source = base_name_override if base_name_override else animation_name
-            clean_name = name_source.replace('|', '_').replace(':', '_').replace('*', '_').replace('?', '_').replace('<', '_').replace('>', '_').replace('"', '_')
-            file_ext = '.png' if not hasattr(self, 'export_format') else ('.png' if self.export_format == 'PNG' else '.webp')
-            frame_path = os.path.join(output_dir, f"{clean_name}_frame_{i:04d}{file_ext}")
-            
-            # Set render format
-            original_format = bpy.context.scene.render.image_settings.file_format
-            bpy.context.scene.render.image_settings.file_format = getattr(self, 'export_format', 'PNG')
-            
-            bpy.context.scene.render.filepath = frame_path
-            bpy.ops.render.render(write_still=True)
-            
-            # Restore original format
-            bpy.context.scene.render.image_settings.file_format = original_format
-            
+            frame_path = frame_paths[i]
+
+            cache_path = None
+            if use_cache:
+                key = hashlib.blake2b(f"{frame_num}|{cache_sig}".encode()).hexdigest()[:16]
+                cache_path = os.path.join(cache_dir, key + file_ext)
+                if os.path.exists(cache_path):
+                    shutil.copyfile(cache_path, frame_path)
+                    continue
+
+            # frame_set triggers a full depsgraph evaluation; skip it when the
+            # scene is already on this frame (single-pose actions, re-exports)
+            if bpy.context.scene.frame_current != frame_num:
+                bpy.context.scene.frame_set(frame_num)
+            # Render without write_still and save from Render Result: keeps the
+            # render session/depsgraph alive instead of re-initializing per frame
+            bpy.ops.render.render(write_still=False)
+            result = bpy.data.images.get('Render Result')
+            if result is not None:
+                result.save_render(frame_path)
+            else:
+                bpy.context.scene.render.filepath = frame_path
+                bpy.ops.render.render(write_still=True)
+
+            if cache_path:
+                try:
+                    shutil.copyfile(frame_path, cache_path)
+                except Exception:
+                    pass
+
+        # Restore original format
+        image_settings.file_format = original_format
+        image_settings.compression = original_compression
+        self._end_fast_render(fast_render_state)
+
+
         # Restore original armature matrix if we applied a correction
         try:
             if orig_matrix is not None and target_obj is not None:
@@ -540,49 +772,275 @@ class BlenderExporter:
         except Exception:
             pass
 
-        return len(frames_to_export)
-    
-    def analyze_animation_bounds(self, target_object, animation_name, padding_enabled=True, padding_percent=20):
-        """Analyze all animation frames to find maximum bounds"""
-        action = bpy.data.actions.get(animation_name)
+        return frame_paths
+
+    def _export_frames_threaded(self, frames_to_export, output_dir, clean_name, file_ext):
+        """Render on the main thread but encode/write frames in a thread pool.
+
+        Pixels are read from a compositor Viewer Node image into NumPy buffers
+        and handed to PIL workers, so zlib/WebP encoding overlaps the next
+        render instead of blocking it. Returns False to request the
+        synchronous write_still fallback.
+        """
+        import concurrent.futures
+        scene = bpy.context.scene
+        viewer_state = None
+        try:
+            viewer_state = self._attach_viewer()
+
+            fmt = {'.webp': 'WEBP', '.jpg': 'JPEG'}.get(file_ext, 'PNG')
+            # Honor the PNG Compression property like the sync path does,
+            # mapped onto PIL's 0-9 zlib level (default 15 -> level 1)
+            props = scene.anim_exporter
+            png_level = max(0, min(9, int(getattr(props, 'png_compression', 15)) // 11))
+            pct = scene.render.resolution_percentage
+            width = scene.render.resolution_x * pct // 100
+            height = scene.render.resolution_y * pct // 100
+            futures = []
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as pool:
+                for i, frame_num in enumerate(frames_to_export):
+                    if scene.frame_current != frame_num:
+                        scene.frame_set(frame_num)
+                    bpy.ops.render.render()
+                    viewer_img = bpy.data.images.get('Viewer Node')
+                    if viewer_img is None:
+                        return False
+                    buf = np.empty(width * height * 4, dtype=np.float32)
+                    viewer_img.pixels.foreach_get(buf)
+                    frame_path = os.path.join(output_dir, f"{clean_name}_frame_{i:04d}{file_ext}")
+                    futures.append(pool.submit(self._encode_frame, buf.reshape(height, width, 4), frame_path, fmt, png_level))
+                for f in futures:
+                    f.result()
+            return True
+        except Exception:
+            return False
+        finally:
+            if viewer_state is not None:
+                self._detach_viewer(viewer_state)
+
+    @staticmethod
+    def _linear_to_srgb_rgba8(buf):
+        """Convert a bottom-up premultiplied linear-float RGBA buffer to
+        top-down straight-alpha sRGB uint8."""
+        alpha = np.flipud(buf[:, :, 3:4])
+        rgb = np.flipud(buf[:, :, :3])
+        # Viewer Node pixels carry premultiplied alpha; un-associate before
+        # the transfer curve so anti-aliased edges match save_render output
+        rgb = np.where(alpha > 0, rgb / np.maximum(alpha, 1e-8), 0.0)
+        rgb = np.where(rgb <= 0.0031308, rgb * 12.92, 1.055 * np.clip(rgb, 0, None) ** (1 / 2.4) - 0.055)
+        return np.clip(np.concatenate((rgb, alpha), axis=2) * 255.0 + 0.5, 0, 255).astype(np.uint8)
+
+    @staticmethod
+    def _encode_frame(buf, frame_path, fmt, png_level=1):
+        """Encode one linear-float RGBA buffer to disk via PIL (worker thread)."""
+        img = _PILImage.fromarray(BlenderExporter._linear_to_srgb_rgba8(buf), 'RGBA')
+        if fmt == 'PNG':
+            img.save(frame_path, 'PNG', compress_level=png_level)
+        elif fmt == 'JPEG':
+            img.convert('RGB').save(frame_path, 'JPEG', quality=90)
+        else:
+            img.save(frame_path, 'WEBP')
+
+    def render_spritesheet_array(self, animation_name, frame_size=(128, 128), start_frame=None,
+                                 end_frame=None, camera_angle="Front", flip_animation=False,
+                                 cols=1, rows=1, export_format='PNG'):
+        """Render frames directly into a uint8 sheet array, skipping the
+        per-frame PNG roundtrip entirely.
+
+        Pixels are read off a compositor Viewer Node into one reused float
+        buffer and blitted into the sheet. Returns (sheet, frame_count), or
+        (None, 0) if the caller should fall back to the disk-based path.
+        """
+        target_obj, action, orig_matrix, frames_to_export, props = self._prepare_export(
+            animation_name, frame_size, start_frame, end_frame, camera_angle, flip_animation, export_format
+        )
+        scene = bpy.context.scene
+        fast_render_state = None
+        viewer_state = None
+        try:
+            viewer_state = self._attach_viewer()
+
+            fast_render_state = self._begin_fast_render()
+            pct = scene.render.resolution_percentage
+            width = frame_size[0] * pct // 100
+            height = frame_size[1] * pct // 100
+            sheet_bytes = rows * height * cols * width * 4
+            self.release_sheet_spill()
+            if sheet_bytes > 256 * 1024 * 1024:
+                # Big grids: back the sheet with a disk memmap so peak RAM
+                # stays at one frame, not the whole sheet
+                import tempfile
+                self._sheet_spill = tempfile.NamedTemporaryFile(prefix="a32d_sheet_", suffix=".raw", delete=False)
+                sheet = np.memmap(self._sheet_spill.name, dtype=np.uint8, mode='w+',
+                                  shape=(rows * height, cols * width, 4))
+            else:
+                sheet = np.zeros((rows * height, cols * width, 4), dtype=np.uint8)
+            buf = np.empty(width * height * 4, dtype=np.float32)  # reused across frames
+            for i, frame_num in enumerate(frames_to_export[:cols * rows]):
+                if scene.frame_current != frame_num:
+                    scene.frame_set(frame_num)
+                bpy.ops.render.render()
+                viewer_img = bpy.data.images.get('Viewer Node')
+                if viewer_img is None:
+                    return None, 0
+                viewer_img.pixels.foreach_get(buf)
+                tile = self._linear_to_srgb_rgba8(buf.reshape(height, width, 4))
+                # Strip layouts skip the row/col bookkeeping: offsets are linear
+                if rows == 1:
+                    sheet[:, i * width:(i + 1) * width, :] = tile
+                elif cols == 1:
+                    sheet[i * height:(i + 1) * height, :, :] = tile
+                else:
+                    col = i % cols
+                    row = i // cols
+                    sheet[row * height:(row + 1) * height, col * width:(col + 1) * width, :] = tile
+            return sheet, len(frames_to_export[:cols * rows])
+        except Exception:
+            return None, 0
+        finally:
+            if viewer_state is not None:
+                self._detach_viewer(viewer_state)
+            if fast_render_state is not None:
+                self._end_fast_render(fast_render_state)
+            try:
+                if orig_matrix is not None and target_obj is not None:
+                    target_obj.matrix_world = orig_matrix
+            except Exception:
+                pass
+
+    def _export_frames_parallel(self, frames_to_export, output_dir, clean_name, export_format):
+        """Render disjoint frame ranges in background Blender subprocesses.
+
+        The scene (with camera/action already set up) is saved to a temp .blend,
+        then each worker renders its chunk via the CLI animation renderer.
+        Returns True on success; False means the caller should render sequentially.
+        """
+        import subprocess
+        import tempfile
+        try:
+            if len(frames_to_export) < 2:
+                return False
+            binary = bpy.app.binary_path
+            if not binary or not os.path.exists(binary):
+                return False
+            workers = max(1, min(os.cpu_count() or 1, len(frames_to_export), 8))
+            if workers < 2:
+                return False
+
+            tmp_dir = tempfile.mkdtemp(prefix="a32d_render_")
+            tmp_blend = os.path.join(tmp_dir, "scene.blend")
+            bpy.ops.wm.save_as_mainfile(filepath=tmp_blend, copy=True)
+
+            file_ext = _EXPORT_EXTS.get(export_format, '.png')
+            # Workers write frame-numbered files; renamed to 0-based index below
+            out_pattern = os.path.join(tmp_dir, "frame_####")
+            # Chunks are slices of the strided range, so they stay aligned to
+            # the step; -j keeps workers from rendering the skipped frames
+            step = getattr(frames_to_export, 'step', 1)
+            chunk_size = math.ceil(len(frames_to_export) / workers)
+            procs = []
+            for w in range(workers):
+                chunk = frames_to_export[w * chunk_size:(w + 1) * chunk_size]
+                if not chunk:
+                    continue
+                cmd = [
+                    binary, "-b", tmp_blend,
+                    "-o", out_pattern,
+                    "-F", export_format,
+                    "-s", str(chunk[0]),
+                    "-e", str(chunk[-1]),
+                    "-j", str(step),
+                    "-a",
+                ]
+                procs.append(subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+            failed = any(p.wait() != 0 for p in procs)
+
+            if not failed:
+                src_template = os.path.join(tmp_dir, f"frame_{{:04d}}{file_ext}")
+                dst_template = os.path.join(output_dir, f"{clean_name}_frame_{{:04d}}{file_ext}")
+                for i, frame_num in enumerate(frames_to_export):
+                    src = src_template.format(frame_num)
+                    if not os.path.exists(src):
+                        failed = True
+                        break
+                    os.replace(src, dst_template.format(i))
+
+            import shutil
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return not failed
+        except Exception:
+            return False
+
+    def analyze_animation_bounds(self, target_object, action, padding_enabled=True, padding_percent=20):
+        """Analyze all animation frames to find maximum bounds.
+
+        Accepts the action datablock directly; a name is resolved once for
+        backward compatibility.
+        """
+        if isinstance(action, str):
+            action = bpy.data.actions.get(action)
         if not action:
             return self.get_static_bounds(target_object)
-        
-        frame_start = int(action.frame_range[0])
-        frame_end = int(action.frame_range[1])
-        
-        all_min_coords = [float('inf')] * 3
-        all_max_coords = [float('-inf')] * 3
-        
-        # Iterate every Nth frame for optimization
-        step = max(1, (frame_end - frame_start) // 20)
+
+        fr = action.frame_range
+        frame_start = int(fr[0])
+        frame_end = int(fr[1])
+
+        all_min = np.full(3, np.inf)
+        all_max = np.full(3, -np.inf)
+
+        # Iterate every Nth frame for optimization (bone samples are cheap)
+        step = max(1, (frame_end - frame_start) // 8)
         for frame in range(frame_start, frame_end + 1, step):
+            # frame_set already evaluates the depsgraph; read the evaluated copy
+            # directly instead of forcing a second view_layer.update(). The
+            # evaluated object also carries posed bounds, unlike the rest bound_box.
             bpy.context.scene.frame_set(frame)
-            bpy.context.view_layer.update()
-            
-            bbox = [target_object.matrix_world @ mathutils.Vector(corner) for corner in target_object.bound_box]
-            frame_min = [min([v[i] for v in bbox]) for i in range(3)]
-            frame_max = [max([v[i] for v in bbox]) for i in range(3)]
-            
-            for i in range(3):
-                all_min_coords[i] = min(all_min_coords[i], frame_min[i])
-                all_max_coords[i] = max(all_max_coords[i], frame_max[i])
-        
-        center = mathutils.Vector([(all_min_coords[i] + all_max_coords[i]) / 2 for i in range(3)])
-        size = max(all_max_coords[i] - all_min_coords[i] for i in range(3))
-        
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            eval_obj = target_object.evaluated_get(depsgraph)
+
+            m = np.array(eval_obj.matrix_world, dtype=np.float64)
+            if eval_obj.type == 'ARMATURE' and len(eval_obj.pose.bones) > 0:
+                # Armature bound_box is the rest box and never changes with pose;
+                # sample the posed bone head/tail point cloud instead
+                pts = np.array(
+                    [list(b.head) for b in eval_obj.pose.bones]
+                    + [list(b.tail) for b in eval_obj.pose.bones],
+                    dtype=np.float64
+                )
+            else:
+                pts = np.array([list(c) for c in eval_obj.bound_box], dtype=np.float64)
+            world = pts @ m[:3, :3].T + m[:3, 3]
+            np.minimum(all_min, world.min(axis=0), out=all_min)
+            np.maximum(all_max, world.max(axis=0), out=all_max)
+
+        center = mathutils.Vector((all_min + all_max) * 0.5)
+        size = float((all_max - all_min).max())
+
         if padding_enabled:
             size *= (1 + padding_percent / 100)
-        
+
         return center, size
     
+    @staticmethod
+    def _world_bbox(obj):
+        """World-space bbox of an object as (min, max) NumPy vectors."""
+        corners = np.fromiter((c for v in obj.bound_box for c in v),
+                              dtype=np.float64, count=24).reshape(8, 3)
+        m = np.array(obj.matrix_world, dtype=np.float64)
+        world = corners @ m[:3, :3].T + m[:3, 3]
+        return world.min(axis=0), world.max(axis=0)
+
     def get_static_bounds(self, target_object):
-        """Get static object bounds"""
-        bbox = [target_object.matrix_world @ mathutils.Vector(corner) for corner in target_object.bound_box]
-        min_coords = [min([v[i] for v in bbox]) for i in range(3)]
-        max_coords = [max([v[i] for v in bbox]) for i in range(3)]
-        center = mathutils.Vector([(min_coords[i] + max_coords[i]) / 2 for i in range(3)])
-        size = max(max_coords[i] - min_coords[i] for i in range(3))
+        """Get static object bounds (cached per object and frame)"""
+        key = (id(target_object), bpy.context.scene.frame_current)
+        cached = self._bbox_cache.get(key)
+        if cached is not None:
+            return cached
+        mn, mx = self._world_bbox(target_object)
+        center = mathutils.Vector((mn + mx) * 0.5)
+        size = float((mx - mn).max())
+        self._bbox_cache[key] = (center, size)
         return center, size
 
 class AnimationExporterProperties(PropertyGroup):
@@ -611,6 +1069,13 @@ class AnimationExporterProperties(PropertyGroup):
         default=1,
         min=1
     )
+
+    frame_step: IntProperty(
+        name="Step:",
+        default=1,
+        min=1,
+        description="Render every Nth frame"
+    )
     
     camera_angle: EnumProperty(
         name="Angle",
@@ -673,10 +1138,46 @@ class AnimationExporterProperties(PropertyGroup):
         name="Format",
         items=[
             ('PNG', "PNG", "Export in PNG format"),
-            ('WEBP', "WEBP", "Export in WEBP format")
+            ('WEBP', "WEBP", "Export in WEBP format"),
+            ('JPEG', "JPEG", "Export in JPEG format (fast, no transparency)")
         ],
         default='PNG'
     )
+
+    render_scale: IntProperty(
+        name="Render Scale",
+        default=100,
+        min=10,
+        max=100,
+        subtype='PERCENTAGE',
+        description="Render resolution percentage (lower for fast preview exports)"
+    )
+
+    png_compression: IntProperty(
+        name="PNG Compression",
+        default=15,
+        min=0,
+        max=100,
+        description="zlib compression level for PNG frames (lower = faster saves, bigger files)"
+    )
+
+    parallel_render: bpy.props.BoolProperty(
+        name="Parallel Render",
+        default=False,
+        description="Render frames in background Blender processes (faster for long animations)"
+    )
+
+    use_frame_cache: bpy.props.BoolProperty(
+        name="Frame Cache",
+        default=False,
+        description="Reuse previously rendered frames from <output>/.cache when settings are unchanged"
+    )
+
+    debug_keep_frames: bpy.props.BoolProperty(
+        name="Keep Frames",
+        default=False,
+        description="Spritesheet export: write and keep per-frame files instead of compositing in memory"
+    )
     
 
 
@@ -789,7 +1290,7 @@ class ANIM_OT_prev_animation(Operator):
 
         # Refresh camera preview to reposition camera if needed
         try:
-            refresh_camera_preview(context)
+            refresh_camera_preview(context, force=True)
         except Exception:
             pass
         
@@ -867,7 +1368,7 @@ class ANIM_OT_next_animation(Operator):
 
         # Refresh camera preview to reposition camera if needed
         try:
-            refresh_camera_preview(context)
+            refresh_camera_preview(context, force=True)
         except Exception:
             pass
         
@@ -890,9 +1391,13 @@ class ANIM_OT_export_frames(Operator):
             self.report({'ERROR'}, "Please set output path")
             return {'CANCELLED'}
             
+        # Lock the UI while rendering: stops per-frame viewport redraws from
+        # stealing CPU and guards against crashes mid-export
+        prev_lock = context.scene.render.use_lock_interface
+        context.scene.render.use_lock_interface = True
         try:
-            exporter = BlenderExporter()
-            
+            exporter = _get_exporter()
+
             # Find the armature that holds the currently selected action (as set by the Prev/Next operators)
             action = None
             target_arm = None
@@ -911,14 +1416,18 @@ class ANIM_OT_export_frames(Operator):
                 
             size = int(props.frame_size)
             angle_map = {'FRONT': 'Front', 'ISO': 'Isometric', 'SIDE': 'Side', 'CUSTOM': 'Custom'}
-            
+
+            # Resolve the output path once: bpy.path.abspath parses '//' tokens
+            # on every call, so it stays out of the frame loop
+            out_dir = os.fspath(os.path.abspath(bpy.path.abspath(props.output_path)))
+
             # Choose export base name for frames
             base_name = getattr(props, 'export_basename', '').strip()
             chosen_name = base_name if base_name else action.name
             
-            frame_count = exporter.export_animation_frames(
+            frame_paths = exporter.export_animation_frames(
                 animation_name=action.name,
-                output_dir=props.output_path,
+                output_dir=out_dir,
                 frame_size=(size, size),
                 start_frame=props.start_frame,
                 end_frame=props.end_frame,
@@ -927,13 +1436,15 @@ class ANIM_OT_export_frames(Operator):
                 export_format=props.export_format,
                 base_name_override=chosen_name
             )
-            
-            self.report({'INFO'}, f"Exported {frame_count} frames to: {props.output_path}")
+
+            self.report({'INFO'}, f"Exported {len(frame_paths)} frames to: {out_dir}")
             return {'FINISHED'}
             
         except Exception as e:
             self.report({'ERROR'}, f"Export failed: {str(e)}")
             return {'CANCELLED'}
+        finally:
+            context.scene.render.use_lock_interface = prev_lock
 
 class ANIM_OT_export_spritesheet(Operator):
     bl_idname = "anim.export_spritesheet"
@@ -951,9 +1462,13 @@ class ANIM_OT_export_spritesheet(Operator):
             self.report({'ERROR'}, "Please set output path")
             return {'CANCELLED'}
             
+        # Lock the UI while rendering: stops per-frame viewport redraws from
+        # stealing CPU and guards against crashes mid-export
+        prev_lock = context.scene.render.use_lock_interface
+        context.scene.render.use_lock_interface = True
         try:
-            exporter = BlenderExporter()
-            
+            exporter = _get_exporter()
+
             # Find the armature that holds the currently selected action (as set by the Prev/Next operators)
             action = None
             target_arm = None
@@ -972,19 +1487,17 @@ class ANIM_OT_export_spritesheet(Operator):
                 
             size = int(props.frame_size)
             angle_map = {'FRONT': 'Front', 'ISO': 'Isometric', 'SIDE': 'Side', 'CUSTOM': 'Custom'}
-            
+
+            # Resolve the output path once (see ANIM_OT_export_frames)
+            out_dir = os.fspath(os.path.abspath(bpy.path.abspath(props.output_path)))
+
             # Choose export name: prefer file base name captured on import, fallback to action name
             base_name = getattr(props, 'export_basename', '').strip()
             chosen_name = base_name if base_name else action.name
-            clean_name = chosen_name.replace('|', '_').replace(':', '_').replace('*', '_').replace('?', '_').replace('<', '_').replace('>', '_').replace('"', '_')
-            file_ext = '.png' if props.export_format == 'PNG' else '.webp'
-            
-            # Simple spritesheet creation
-            temp_dir = os.path.join(props.output_path, "temp_frames")
-            os.makedirs(temp_dir, exist_ok=True)
+            clean_name = chosen_name.translate(_INVALID_FN)
+            file_ext = _EXPORT_EXTS.get(props.export_format, '.png')
             
             # Auto-calc grid like GUI: square-ish (cols ~ sqrt(n), rows = ceil(n/cols))
-            import math
             # derive desired frame count from range
             action_start = int(action.frame_range[0])
             action_end = int(action.frame_range[1])
@@ -992,14 +1505,55 @@ class ANIM_OT_export_spritesheet(Operator):
             end_f = min(action_end, int(props.end_frame))
             if start_f > end_f:
                 start_f, end_f = end_f, start_f
-            desired_frames = end_f - start_f + 1
-            cols = int(math.ceil(math.sqrt(desired_frames)))
-            rows = int(math.ceil(desired_frames / cols))
+            step = max(1, int(getattr(props, 'frame_step', 1)))
+            desired_frames = len(range(start_f, end_f + 1, step))
+            if props.auto_grid:
+                cols = int(math.ceil(math.sqrt(desired_frames)))
+                rows = int(math.ceil(desired_frames / cols))
+            else:
+                cols = int(props.sprite_columns)
+                rows = int(props.sprite_rows)
             max_frames = cols * rows
             
             export_count = min(desired_frames, max_frames)
-            end_export = start_f + export_count - 1
-            frame_count = exporter.export_animation_frames(
+            end_export = start_f + (export_count - 1) * step
+            output_file = os.path.join(out_dir, f"{clean_name}_sh_{rows}x{cols}{file_ext}")
+
+            # In-memory path: render tiles straight into the sheet, no per-frame
+            # PNG encode/decode roundtrip (Debug Keep Frames forces the disk path)
+            if (_PIL_AVAILABLE and not getattr(props, 'debug_keep_frames', False)
+                    and not props.parallel_render and not props.use_frame_cache):
+                sheet, rendered = exporter.render_spritesheet_array(
+                    animation_name=action.name,
+                    frame_size=(size, size),
+                    start_frame=start_f,
+                    end_frame=end_export,
+                    camera_angle=angle_map[props.camera_angle],
+                    flip_animation=props.flip_animation,
+                    cols=cols,
+                    rows=rows,
+                    export_format=props.export_format
+                )
+                if sheet is not None and rendered:
+                    out_img = _PILImage.fromarray(np.asarray(sheet), 'RGBA')
+                    if props.export_format == 'WEBP':
+                        out_img.save(output_file, 'WEBP')
+                    elif props.export_format == 'JPEG':
+                        out_img.convert('RGB').save(output_file, 'JPEG', quality=90)
+                    else:
+                        # Map the 0-100 UI compression onto PIL's 0-9 zlib level
+                        # (default 15 -> level 1, fast encode)
+                        level = max(0, min(9, int(getattr(props, 'png_compression', 15)) // 11))
+                        out_img.save(output_file, 'PNG', compress_level=level)
+                    del out_img, sheet
+                    exporter.release_sheet_spill()
+                    self.report({'INFO'}, f"Exported spritesheet: {output_file} ({rows}x{cols})")
+                    return {'FINISHED'}
+
+            # Disk path: render frames to temp files, then assemble
+            temp_dir = os.path.join(out_dir, "temp_frames")
+            os.makedirs(temp_dir, exist_ok=True)
+            frame_paths = exporter.export_animation_frames(
                 animation_name=action.name,
                 output_dir=temp_dir,
                 frame_size=(size, size),
@@ -1009,79 +1563,65 @@ class ANIM_OT_export_spritesheet(Operator):
                 flip_animation=props.flip_animation,
                 export_format=props.export_format
             )
-            
-            # Create spritesheet using GUI logic (PIL if available), fallback to Blender image API
-            file_ext = '.png' if props.export_format == 'PNG' else '.webp'
-            # Sort files by frame number for correct order
-            all_files = [f for f in os.listdir(temp_dir) if f.lower().endswith(file_ext)]
-            frame_files = sorted(all_files, key=lambda x: int(x.split('_frame_')[1].split('.')[0]) if '_frame_' in x else 0)
+            frame_count = len(frame_paths)
 
-            output_file = os.path.join(props.output_path, f"{clean_name}_sh_{rows}x{cols}{file_ext}")
-
-            if frame_files and len(frame_files) >= frame_count:
+            # Frame paths come back from the exporter already ordered — no
+            # directory listing or filename parsing needed
+            if frame_paths:
+                # Actual rendered tile size accounts for the render scale
+                size = size * int(getattr(props, 'render_scale', 100)) // 100
                 spritesheet_width = cols * size
                 spritesheet_height = rows * size
 
                 if _PIL_AVAILABLE:
-                    # PIL-based spritesheet creation
-                    sheet = _PILImage.new('RGBA', (spritesheet_width, spritesheet_height))
-                    for i, frame_file in enumerate(frame_files[:frame_count]):
-                        frame_path = os.path.join(temp_dir, frame_file)
-                        try:
-                            img = _PILImage.open(frame_path).convert('RGBA')
-                        except Exception:
-                            continue
-                        col = i % cols
-                        row = i // cols
-                        x_offset = col * size
-                        y_offset = row * size
-                        sheet.paste(img, (x_offset, y_offset))
+                    # Accumulate tiles in a uint8 NumPy sheet: frames are read
+                    # once into uint8 buffers, no Blender image datablocks and
+                    # no float32 staging copies. Rows are independent bands, so
+                    # decode+blit runs threaded (PIL and NumPy release the GIL)
+                    sheet = np.zeros((spritesheet_height, spritesheet_width, 4), dtype=np.uint8)
+
+                    def blit_row(row):
+                        for col in range(cols):
+                            idx = row * cols + col
+                            if idx >= frame_count:
+                                return
+                            try:
+                                img = _PILImage.open(frame_paths[idx])
+                                if img.mode != 'RGBA':
+                                    img = img.convert('RGBA')
+                                tile = np.asarray(img, dtype=np.uint8)
+                                sheet[row * size:(row + 1) * size, col * size:(col + 1) * size, :] = tile
+                            except Exception:
+                                continue
+
+                    if rows > 1:
+                        import concurrent.futures
+                        workers = max(2, min(rows, (os.cpu_count() or 2) // 2))
+                        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                            list(pool.map(blit_row, range(rows)))
+                    else:
+                        blit_row(0)
                     # Save with correct format
+                    out_img = _PILImage.fromarray(sheet, 'RGBA')
                     if props.export_format == 'WEBP':
-                        sheet.save(output_file, 'WEBP')
+                        out_img.save(output_file, 'WEBP')
+                    elif props.export_format == 'JPEG':
+                        out_img.convert('RGB').save(output_file, 'JPEG', quality=90)
                     else:
-                        sheet.save(output_file, 'PNG')
+                        level = max(0, min(9, int(getattr(props, 'png_compression', 15)) // 11))
+                        out_img.save(output_file, 'PNG', compress_level=level)
                 else:
-                    # Fallback: Blender image API
-                    spritesheet_img = bpy.data.images.new("Spritesheet", spritesheet_width, spritesheet_height, alpha=True)
-                    frame_images = []
-                    for i, frame_file in enumerate(frame_files[:frame_count]):
-                        frame_path = os.path.join(temp_dir, frame_file)
-                        if os.path.exists(frame_path):
-                            img = bpy.data.images.load(frame_path)
-                            frame_images.append(img)
-                    pixels = [0.0, 0.0, 0.0, 0.0] * (spritesheet_width * spritesheet_height)
-                    for frame_index in range(min(frame_count, len(frame_images), cols * rows)):
-                        img = frame_images[frame_index]
-                        col = frame_index % cols
-                        row = frame_index // cols
-                        frame_pixels = [0.0] * (size * size * 4)
-                        img.pixels.foreach_get(frame_pixels)
-                        for y in range(size):
-                            for x in range(size):
-                                src_idx = (y * size + x) * 4
-                                dst_x = col * size + x
-                                # Place row 0 at top (Blender images use bottom-left origin): map row 0 to top row
-                                dst_y = (rows - 1 - row) * size + y
-                                dst_idx = (dst_y * spritesheet_width + dst_x) * 4
-                                if dst_idx + 3 < len(pixels) and src_idx + 3 < len(frame_pixels):
-                                    pixels[dst_idx] = frame_pixels[src_idx]
-                                    pixels[dst_idx+1] = frame_pixels[src_idx+1]
-                                    pixels[dst_idx+2] = frame_pixels[src_idx+2]
-                                    pixels[dst_idx+3] = frame_pixels[src_idx+3]
-                    spritesheet_img.pixels.foreach_set(pixels)
-                    spritesheet_img.update()
-                    spritesheet_img.filepath_raw = output_file
-                    spritesheet_img.file_format = 'WEBP' if props.export_format == 'WEBP' else 'PNG'
-                    spritesheet_img.save()
-                    for img in frame_images:
-                        bpy.data.images.remove(img)
-                    bpy.data.images.remove(spritesheet_img)
+                    # Fallback: composite all frames in a single GPU render pass
+                    self.create_spritesheet_compositor(
+                        frame_paths[:frame_count], output_file,
+                        size, cols, rows, props.export_format
+                    )
             
-            # Cleanup temp files
-            import shutil
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
+            # Cleanup temp files (kept for inspection with Debug Keep Frames)
+            if not getattr(props, 'debug_keep_frames', False):
+                import shutil
+                if os.path.exists(temp_dir):
+                    shutil.rmtree(temp_dir)
             
             self.report({'INFO'}, f"Exported spritesheet: {output_file} ({rows}x{cols})")
             return {'FINISHED'}
@@ -1089,79 +1629,113 @@ class ANIM_OT_export_spritesheet(Operator):
         except Exception as e:
             self.report({'ERROR'}, f"Export failed: {str(e)}")
             return {'CANCELLED'}
-            
-    def create_spritesheet_simple_unused(self, temp_dir, output_path, frame_size, cols, rows, frame_count):
-        """Create spritesheet by combining frames"""
-        frame_files = sorted([f for f in os.listdir(temp_dir) if f.endswith('.png')])
-        
-        if not frame_files:
+        finally:
+            context.scene.render.use_lock_interface = prev_lock
+
+    def create_spritesheet_compositor(self, frame_paths, output_path, frame_size, cols, rows, export_format='PNG'):
+        """Assemble the spritesheet on the GPU: one Image+Translate node per frame
+        chained through AlphaOver into a single composite render."""
+        if not frame_paths:
             raise Exception("No frames found")
-            
+
+        scene = bpy.context.scene
+
         # Set render resolution for spritesheet
-        original_x = bpy.context.scene.render.resolution_x
-        original_y = bpy.context.scene.render.resolution_y
-        
-        bpy.context.scene.render.resolution_x = cols * frame_size
-        bpy.context.scene.render.resolution_y = rows * frame_size
-        
-        # Use compositor to combine frames
-        bpy.context.scene.use_nodes = True
-        tree = bpy.context.scene.node_tree
-        tree.nodes.clear()
-        
-        # Create output node
-        output_node = tree.nodes.new('CompositorNodeComposite')
-        output_node.location = (800, 0)
-        
-        # Create viewer node for background
-        viewer = tree.nodes.new('CompositorNodeViewer')
-        viewer.location = (600, 0)
-        
-        # Create alpha over node for combining
-        alpha_node = tree.nodes.new('CompositorNodeAlphaOver')
-        alpha_node.location = (600, 0)
-        tree.links.new(alpha_node.outputs[0], output_node.inputs[0])
-        
-        # Load and position all frames
-        for i, frame_file in enumerate(frame_files[:frame_count]):
-            frame_path = os.path.join(temp_dir, frame_file)
-            img = bpy.data.images.load(frame_path)
-            
-            # Create image node
-            img_node = tree.nodes.new('CompositorNodeImage')
-            img_node.image = img
-            img_node.location = (i * 150, -i * 100)
-            
-            # Calculate position in grid
-            col = i % cols
-            row = i // cols
-            
-            # Create translate node for positioning
-            translate_node = tree.nodes.new('CompositorNodeTranslate')
-            translate_node.inputs[1].default_value = col * frame_size - (cols * frame_size) / 2 + frame_size / 2
-            translate_node.inputs[2].default_value = (rows * frame_size) / 2 - row * frame_size - frame_size / 2
-            translate_node.location = (i * 150 + 100, -i * 100)
-            
-            tree.links.new(img_node.outputs[0], translate_node.inputs[0])
-            
-            if i == 0:
-                tree.links.new(translate_node.outputs[0], alpha_node.inputs[1])
-            else:
-                # Create new alpha over for each additional frame
-                new_alpha = tree.nodes.new('CompositorNodeAlphaOver')
-                new_alpha.location = (400 + i * 50, 0)
-                tree.links.new(alpha_node.outputs[0], new_alpha.inputs[1])
-                tree.links.new(translate_node.outputs[0], new_alpha.inputs[2])
-                tree.links.new(new_alpha.outputs[0], output_node.inputs[0])
-                alpha_node = new_alpha
-        
-        # Render the spritesheet
-        bpy.context.scene.render.filepath = output_path
-        bpy.ops.render.render(write_still=True)
-        
-        # Restore original resolution
-        bpy.context.scene.render.resolution_x = original_x
-        bpy.context.scene.render.resolution_y = original_y
+        original_x = scene.render.resolution_x
+        original_y = scene.render.resolution_y
+        original_pct = scene.render.resolution_percentage
+        original_format = scene.render.image_settings.file_format
+
+        scene.render.resolution_x = cols * frame_size
+        scene.render.resolution_y = rows * frame_size
+        # The tiles on disk already carry any render scale; the sheet canvas
+        # and translate offsets are computed 1:1, so render at 100%
+        scene.render.resolution_percentage = 100
+        scene.render.image_settings.file_format = export_format
+
+        # Use compositor to combine frames; the user's nodes are kept and our
+        # temporary chain is removed again afterwards (like _detach_viewer)
+        prev_use_nodes = scene.use_nodes
+        scene.use_nodes = True
+        tree = scene.node_tree
+
+        loaded_images = []
+        created_nodes = []
+        # Any pre-existing Composite output would compete with ours; mute it
+        # for the duration of the sheet render
+        muted_nodes = []
+        for node in tree.nodes:
+            if node.type == 'COMPOSITE' and not node.mute:
+                node.mute = True
+                muted_nodes.append(node)
+        try:
+            output_node = tree.nodes.new('CompositorNodeComposite')
+            output_node.location = (800, 0)
+            created_nodes.append(output_node)
+
+            # Grid offsets for every frame in two vectorized passes
+            idx = np.arange(len(frame_paths))
+            tx = (idx % cols) * frame_size - (cols * frame_size) / 2 + frame_size / 2
+            ty = (rows * frame_size) / 2 - (idx // cols) * frame_size - frame_size / 2
+
+            prev_output = None
+            for i, frame_path in enumerate(frame_paths):
+                img = bpy.data.images.load(frame_path)
+                loaded_images.append(img)
+
+                img_node = tree.nodes.new('CompositorNodeImage')
+                img_node.image = img
+                img_node.location = (i * 150, -i * 100)
+                created_nodes.append(img_node)
+
+                translate_node = tree.nodes.new('CompositorNodeTranslate')
+                translate_node.inputs[1].default_value = float(tx[i])
+                translate_node.inputs[2].default_value = float(ty[i])
+                translate_node.location = (i * 150 + 100, -i * 100)
+                created_nodes.append(translate_node)
+
+                tree.links.new(img_node.outputs[0], translate_node.inputs[0])
+
+                if prev_output is None:
+                    prev_output = translate_node.outputs[0]
+                else:
+                    alpha_node = tree.nodes.new('CompositorNodeAlphaOver')
+                    alpha_node.location = (400 + i * 50, 0)
+                    created_nodes.append(alpha_node)
+                    tree.links.new(prev_output, alpha_node.inputs[1])
+                    tree.links.new(translate_node.outputs[0], alpha_node.inputs[2])
+                    prev_output = alpha_node.outputs[0]
+
+            tree.links.new(prev_output, output_node.inputs[0])
+
+            # Render the spritesheet in a single pass
+            scene.render.filepath = output_path
+            bpy.ops.render.render(write_still=True)
+        finally:
+            # Remove our temporary chain and restore the user's compositor,
+            # even if the render fails
+            for node in created_nodes:
+                try:
+                    tree.nodes.remove(node)
+                except Exception:
+                    pass
+            for node in muted_nodes:
+                try:
+                    node.mute = False
+                except Exception:
+                    pass
+            scene.use_nodes = prev_use_nodes
+            # Drop the per-frame datablocks so bpy.data.images does not grow
+            # O(frames) across retries
+            for img in loaded_images:
+                try:
+                    bpy.data.images.remove(img)
+                except Exception:
+                    pass
+            scene.render.resolution_x = original_x
+            scene.render.resolution_y = original_y
+            scene.render.resolution_percentage = original_pct
+            scene.render.image_settings.file_format = original_format
 
 # Debug operator removed per request
 
@@ -1201,7 +1775,7 @@ class ANIM_OT_import_model(Operator, ImportHelper):
                 self.remove_default_collection()
             # Analyze imported actions for rotation corrections (help fix GLB misaligned actions)
             try:
-                exporter = BlenderExporter()
+                exporter = _get_exporter()
                 exporter.analyze_and_store_action_rotations()
             except Exception:
                 pass
@@ -1245,7 +1819,7 @@ class ANIM_OT_import_model(Operator, ImportHelper):
             except Exception:
                 pass
             # Create/position camera immediately for live preview
-            refresh_camera_preview(context)
+            refresh_camera_preview(context, force=True)
             self.report({'INFO'}, f"Import completed")
             return {'FINISHED'}
             
@@ -1270,27 +1844,22 @@ class ANIM_OT_import_model(Operator, ImportHelper):
             pass
     
     def setup_imported_objects(self, clean_import=True):
-        # Normalize scale only for objects smaller than 1.0
+        # Normalize scale only for objects smaller than 1.0; skip the write
+        # entirely when nothing changes to avoid needless depsgraph tagging
         for obj in bpy.data.objects:
             if obj.type in ['MESH', 'ARMATURE']:
-                new_scale = [
-                    max(obj.scale[0], 1.0) if obj.scale[0] < 1.0 else obj.scale[0],
-                    max(obj.scale[1], 1.0) if obj.scale[1] < 1.0 else obj.scale[1],
-                    max(obj.scale[2], 1.0) if obj.scale[2] < 1.0 else obj.scale[2]
-                ]
-                obj.scale = new_scale
+                sx, sy, sz = obj.scale
+                if sx < 1.0 or sy < 1.0 or sz < 1.0:
+                    obj.scale = (max(sx, 1.0), max(sy, 1.0), max(sz, 1.0))
         
         # Auto-focus on imported objects
         self.auto_focus_imported_objects()
                 
         # Set side view (-X)
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for space in area.spaces:
-                    if space.type == 'VIEW_3D':
-                        bpy.ops.view3d.view_axis(type='LEFT')
-                        break
-                break
+        area, region, _space = _view3d_target()
+        if area is not None and region is not None:
+            with bpy.context.temp_override(area=area, region=region):
+                bpy.ops.view3d.view_axis(type='LEFT')
                 
         # Configure materials
         for material in bpy.data.materials:
@@ -1304,46 +1873,46 @@ class ANIM_OT_import_model(Operator, ImportHelper):
                         break
                 
                 if principled:
-                    principled.inputs['Metallic'].default_value = 0.0
-                    principled.inputs['Roughness'].default_value = 1.0
-                    principled.inputs['IOR'].default_value = 1.2
-                    
-                    if principled.inputs['Alpha'].is_linked:
-                        material.node_tree.links.remove(principled.inputs['Alpha'].links[0])
-                    if principled.inputs['Normal'].is_linked:
-                        material.node_tree.links.remove(principled.inputs['Normal'].links[0])
+                    # Resolve the inputs collection once per material: each
+                    # attribute access is an RNA dispatch
+                    inputs = principled.inputs
+                    inputs['Metallic'].default_value = 0.0
+                    inputs['Roughness'].default_value = 1.0
+                    inputs['IOR'].default_value = 1.2
+
+                    if inputs['Alpha'].is_linked:
+                        material.node_tree.links.remove(inputs['Alpha'].links[0])
+                    if inputs['Normal'].is_linked:
+                        material.node_tree.links.remove(inputs['Normal'].links[0])
                     # Ensure only Base Color affects shading: robustly detach emission inputs
                     try:
                         links = material.node_tree.links
                         # Handle both legacy and newer names
-                        emission_names = {"Emission", "Emission Color"}
-                        strength_names = {"Emission Strength"}
-                        # Detach all links going into emission-related inputs
-                        for inp in principled.inputs:
-                            if inp.name in emission_names or inp.name in strength_names:
-                                if inp.is_linked:
-                                    # remove all links targeting this input
-                                    for l in list(inp.links):
-                                        if l.to_node == principled and l.to_socket == inp:
-                                            links.remove(l)
-                                # zero defaults
-                                if inp.name in emission_names:
-                                    try:
-                                        # color (RGB or RGBA)
-                                        dv = inp.default_value
-                                        if isinstance(dv, tuple) or isinstance(dv, list):
-                                            # keep length
-                                            zeros = [0.0] * len(dv)
-                                            inp.default_value = zeros
-                                        else:
-                                            inp.default_value = 0.0
-                                    except Exception:
-                                        pass
-                                if inp.name in strength_names:
-                                    try:
+                        # Look the sockets up by name (C-side hash) instead of
+                        # iterating every input of the node
+                        for name in ("Emission", "Emission Color", "Emission Strength"):
+                            inp = principled.inputs.get(name)
+                            if inp is None:
+                                continue
+                            if inp.is_linked:
+                                # remove all links targeting this input
+                                for l in list(inp.links):
+                                    if l.to_node == principled and l.to_socket == inp:
+                                        links.remove(l)
+                            # zero defaults
+                            try:
+                                if name == "Emission Strength":
+                                    inp.default_value = 0.0
+                                else:
+                                    # color (RGB or RGBA)
+                                    dv = inp.default_value
+                                    if isinstance(dv, (tuple, list)):
+                                        # keep length
+                                        inp.default_value = [0.0] * len(dv)
+                                    else:
                                         inp.default_value = 0.0
-                                    except Exception:
-                                        pass
+                            except Exception:
+                                pass
                     except Exception:
                         pass
                 
@@ -1380,22 +1949,27 @@ class ANIM_OT_import_model(Operator, ImportHelper):
                 return
             master = scene.collection
             # Move contents of any child named 'Collection' directly to master, then remove that child
+            # Set-based membership: 'name in collection' is a linear RNA scan
+            master_obj_names = set(master.objects.keys())
+            master_child_names = set(master.children.keys())
             default_child = None
             for child in list(master.children):
                 if child.name == "Collection":
                     default_child = child
                     # Move objects
                     for obj in list(child.objects):
-                        if obj.name not in master.objects:
+                        if obj.name not in master_obj_names:
                             master.objects.link(obj)
+                            master_obj_names.add(obj.name)
                         try:
                             child.objects.unlink(obj)
                         except Exception:
                             pass
                     # Move grandchildren collections to master
                     for sub in list(child.children):
-                        if sub not in master.children:
+                        if sub.name not in master_child_names:
                             master.children.link(sub)
+                            master_child_names.add(sub.name)
                         try:
                             child.children.unlink(sub)
                         except Exception:
@@ -1428,30 +2002,20 @@ class ANIM_OT_import_model(Operator, ImportHelper):
             context.scene.anim_exporter.end_frame = int(first_action.frame_range[1])
     
     def clear_scene_and_cache(self):
-        # Clear all objects
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete()
-        
-        # Clear animations
-        for action in bpy.data.actions:
-            bpy.data.actions.remove(action)
-        
-        # Clear materials
-        for material in bpy.data.materials:
-            bpy.data.materials.remove(material)
-        
-        # Clear meshes
-        for mesh in bpy.data.meshes:
-            bpy.data.meshes.remove(mesh)
-        
-        # Clear armatures
-        for armature in bpy.data.armatures:
-            bpy.data.armatures.remove(armature)
-        
-        # Clear images
-        for image in bpy.data.images:
-            if image.users == 0:
-                bpy.data.images.remove(image)
+        # Batch removal: one depsgraph pass per datablock type instead of
+        # per-element remove() calls (and no operator/undo overhead for objects)
+        bpy.data.batch_remove(ids=list(bpy.data.objects))
+        bpy.data.batch_remove(ids=list(bpy.data.actions))
+        bpy.data.batch_remove(ids=list(bpy.data.materials))
+        bpy.data.batch_remove(ids=list(bpy.data.meshes))
+        bpy.data.batch_remove(ids=list(bpy.data.armatures))
+        bpy.data.batch_remove(ids=[image for image in bpy.data.images if image.users == 0])
+
+        # Lights were just wiped; let the next exporter run redo scene setup
+        try:
+            bpy.context.scene['_a32d_initialized'] = False
+        except Exception:
+            pass
     
     def flatten_hierarchy_and_center(self):
         """Витягує модель з ієрархії Empty об'єктів (тільки GLB)"""
@@ -1488,8 +2052,10 @@ class ANIM_OT_import_model(Operator, ImportHelper):
     def auto_focus_imported_objects(self):
         """Auto-focus viewport on imported objects"""
         try:
-            # Select all imported objects
-            bpy.ops.object.select_all(action='DESELECT')
+            # Select all imported objects (direct data API skips the operator's
+            # undo push and redraw pass)
+            for obj in bpy.context.view_layer.objects:
+                obj.select_set(False)
             for obj in bpy.data.objects:
                 if obj.type in ['MESH', 'ARMATURE']:
                     obj.select_set(True)
@@ -1499,20 +2065,16 @@ class ANIM_OT_import_model(Operator, ImportHelper):
             # Перевіряємо чи є Empty об'єкти (означає GLB)
             has_empty = any(obj.type == 'EMPTY' for obj in bpy.data.objects)
             
-            for area in bpy.context.screen.areas:
-                if area.type == 'VIEW_3D':
-                    for region in area.regions:
-                        if region.type == 'WINDOW':
-                            with bpy.context.temp_override(area=area, region=region):
-                                if has_empty:  # GLB - фокус на курсор
-                                    bpy.ops.view3d.view_center_cursor()
-                                    # Збільшуємо масштаб
-                                    for _ in range(6):
-                                        bpy.ops.view3d.zoom(delta=1)
-                                else:  # FBX - фокус на об'єкти
-                                    bpy.ops.view3d.view_selected()
-                            break
-                    break
+            area, region, _space = _view3d_target()
+            if area is not None and region is not None:
+                with bpy.context.temp_override(area=area, region=region):
+                    if has_empty:  # GLB - фокус на курсор
+                        bpy.ops.view3d.view_center_cursor()
+                        # Збільшуємо масштаб
+                        for _ in range(6):
+                            bpy.ops.view3d.zoom(delta=1)
+                    else:  # FBX - фокус на об'єкти
+                        bpy.ops.view3d.view_selected()
         except Exception:
             pass
 
@@ -1525,8 +2087,16 @@ class ANIM_PT_exporter_panel(Panel):
     
     def draw(self, context):
         layout = self.layout
+        # Animate-decorator columns force an extra relayout pass per row; the
+        # exporter settings are never keyframed
+        layout.use_property_decorate = False
         props = context.scene.anim_exporter
-        
+        # draw() runs on every redraw; read branch-deciding RNA props once
+        cam_angle = props.camera_angle
+        auto_cam = props.auto_camera
+        fmt = props.export_format
+        auto_grid = props.auto_grid
+
         box = layout.box()
         box.label(text="Import Animation:")
         box.prop(props, "clean_import")
@@ -1539,6 +2109,7 @@ class ANIM_PT_exporter_panel(Panel):
         row = frame_box.row()
         row.prop(props, "start_frame")
         row.prop(props, "end_frame")
+        row.prop(props, "frame_step")
         row = frame_box.row()
         row.operator("anim.prev_animation", text="< Anim")
         row.operator("anim.next_animation", text="Anim >")
@@ -1547,13 +2118,13 @@ class ANIM_PT_exporter_panel(Panel):
         cam_box = layout.box()
         cam_box.label(text="Camera Settings:")
         cam_box.prop(props, "camera_angle")
-        if props.camera_angle == 'CUSTOM':
+        if cam_angle == 'CUSTOM':
             cam_box.prop(props, "custom_orientation")
             cam_box.prop(props, "custom_camera_deg")
         cam_box.prop(props, "flip_animation")
         cam_box.prop(props, "auto_camera")
-        
-        if props.auto_camera:
+
+        if auto_cam:
             pass  # Нічого додаткового в авто режимі
         else:
             cam_box.prop(props, "manual_camera_scale")
@@ -1562,6 +2133,18 @@ class ANIM_PT_exporter_panel(Panel):
         export_box = layout.box()
         export_box.label(text="Export:")
         export_box.prop(props, "export_format")
+        if fmt == 'PNG':
+            export_box.prop(props, "png_compression")
+        export_box.prop(props, "auto_grid")
+        if not auto_grid:
+            # Manual grid controls are only laid out when they apply
+            row = export_box.row()
+            row.prop(props, "sprite_columns")
+            row.prop(props, "sprite_rows")
+        export_box.prop(props, "parallel_render")
+        export_box.prop(props, "use_frame_cache")
+        export_box.prop(props, "debug_keep_frames")
+        export_box.prop(props, "render_scale")
         export_box.prop(props, "output_path")
         row = export_box.row()
         row.operator("anim.export_frames", text="Sprites", icon='RENDER_ANIMATION')
@@ -1577,10 +2160,15 @@ classes = [
     ANIM_PT_exporter_panel
 ]
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-    bpy.types.Scene.anim_exporter = bpy.props.PointerProperty(type=AnimationExporterProperties)
+    _register_classes()
+    # Skip redundant RNA work when the add-on is reloaded
+    if not hasattr(bpy.types.Scene, 'anim_exporter'):
+        bpy.types.Scene.anim_exporter = bpy.props.PointerProperty(type=AnimationExporterProperties)
+    if _invalidate_exporter_on_load not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_invalidate_exporter_on_load)
     # Schedule a one-shot startup setup to configure viewport and collections
     try:
         bpy.app.timers.register(_startup_setup_once, first_interval=0.5)
@@ -1588,14 +2176,15 @@ def register():
         pass
 
 def unregister():
-    for cls in classes:
-        bpy.utils.unregister_class(cls)
-    del bpy.types.Scene.anim_exporter
+    _unregister_classes()
+    if _invalidate_exporter_on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_invalidate_exporter_on_load)
+    if hasattr(bpy.types.Scene, 'anim_exporter'):
+        del bpy.types.Scene.anim_exporter
 
 if __name__ == "__main__":
-    # Clear scene on script start
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-    
+    # Clear scene on script start: one bulk removal, no per-object operator dispatch
+    bpy.data.batch_remove(ids=list(bpy.data.objects))
+
     register()
     print("3D to 2D Animation Exporter (Simple) loaded!")
\ No newline at end of file